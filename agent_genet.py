@@ -4,7 +4,7 @@ import random
 class A_GENET:
 
     # Constructor de la clase
-    def __init__(self,laberinto, xi, yi,cromosomas,generacion):
+    def __init__(self,laberinto, xi, yi,cromosomas,generacion, mostrar=True):
         # Instancia del laberinto
         self.lab = laberinto
         # Coordenadas de inicio del agente
@@ -17,6 +17,8 @@ class A_GENET:
         self.cromosoma = cromosomas
         # Cantidad de generaciones
         self.generacion =generacion
+        # Imprimir el progreso de cada generacion
+        self.mostrar = mostrar
 
     # Lista de movimientos aleatorios
     def crear_cromosoma(self):
@@ -124,10 +126,12 @@ class A_GENET:
             # Mostrar mejor fitness de la generacion
             mejor = min(poblacion, key=lambda c: self.fitness(c))
             mejor_fitness=self.fitness(mejor)
-            print(f"Generación {gen + 1}: Mejor fitness = {mejor_fitness}")
+            if self.mostrar:
+                print(f"Generación {gen + 1}: Mejor fitness = {mejor_fitness}")
 
             if mejor_fitness == 1:  # Tolerancia pequeña para errores mínimos
-                print(f"Solución encontrada en generación {gen + 1}")
+                if self.mostrar:
+                    print(f"Solución encontrada en generación {gen + 1}")
                 break
 
         # Retornar mejor cromosoma encontrado
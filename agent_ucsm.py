@@ -4,7 +4,7 @@ from heapq import heappush, heappop
 class A_UCS:
 
     # Constructor del agente
-    def __init__(self, laberinto, xi, yi,):
+    def __init__(self, laberinto, xi, yi, mostrar=True):
         # Instancia del laberinto
         self.lab = laberinto
         # Coordenadas de inicio del agente
@@ -15,6 +15,8 @@ class A_UCS:
         self.ruta = []
         # contador de pasos realizados
         self.pasos = 0
+        # Imprimir avisos de salidas falsas
+        self.mostrar = mostrar
 
     # Funcion que encuentra el camino mas corto desde la posicion actual hasta el la posicion objetivo
     def ucs(self, xo,yo):
@@ -75,7 +77,8 @@ class A_UCS:
 
         # Si no, o es falsa False
         elif self.pos in self.salidas:
-            print(f"Salida falsa, busca otra")
+            if self.mostrar:
+                print(f"Salida falsa, busca otra")
             self.salidas.remove(self.pos)
             self.ruta = []
             return False
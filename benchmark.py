@@ -0,0 +1,241 @@
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from laberinto import Laberinto
+from agent_ucsm import A_UCS
+from agent_genet import A_GENET
+
+# Baseline versionado contra el que se comparan las ejecuciones
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Experimentacion", "baseline_benchmark.json")
+
+
+# Crea un laberinto generado y reproducible para la semilla dada
+def crear_laberinto(tamaño, semilla):
+    random.seed(semilla)
+    laberinto = Laberinto(
+        tamaño=tamaño,
+        x_i=1,
+        y_i=1,
+        intervalo=10.0,
+        num_salidas=tamaño // 3
+    )
+    laberinto.generar_completamente()
+    return laberinto
+
+
+# Cada caso tiene una preparacion (no medida) y una ejecucion (medida)
+def caso_generar(tamaño, semilla):
+    random.seed(semilla)
+    laberinto = Laberinto(tamaño=tamaño, x_i=1, y_i=1, intervalo=10.0, num_salidas=tamaño // 3)
+    return laberinto.generar_completamente
+
+
+def caso_cambios(tamaño, semilla):
+    laberinto = crear_laberinto(tamaño, semilla)
+    return laberinto.ejecutar_cambios_dinamicos
+
+
+def caso_ucs(tamaño, semilla):
+    laberinto = crear_laberinto(tamaño, semilla)
+    agente = A_UCS(laberinto, 1, 1)
+    xo, yo = laberinto.salida_valida
+    return lambda: agente.ucs(xo, yo)
+
+
+def caso_mover(tamaño, semilla):
+    laberinto = crear_laberinto(tamaño, semilla)
+    agente = A_UCS(laberinto, 1, 1, mostrar=False)
+
+    def ejecutar():
+        for _ in range(tamaño):
+            agente.mover()
+            if agente.meta_alcanzada():
+                break
+    return ejecutar
+
+
+def caso_evolucionar(tamaño, semilla):
+    laberinto = crear_laberinto(tamaño, semilla)
+    agente = A_GENET(laberinto, 1, 1, tamaño * 5, tamaño * 2, mostrar=False)
+    return agente.evolucionar
+
+
+# Suite estandar: (nombre, preparacion, tamaño)
+SUITE = [
+    ("Laberinto.generar_completamente", caso_generar, 51),
+    ("Laberinto.ejecutar_cambios_dinamicos", caso_cambios, 51),
+    ("A_UCS.ucs", caso_ucs, 51),
+    ("A_UCS.mover", caso_mover, 31),
+    ("A_GENET.evolucionar", caso_evolucionar, 11),
+]
+
+
+# Ejecuta una muestra y retorna el tiempo en segundos
+def medir_tiempo(preparar, tamaño, semilla):
+    ejecutar = preparar(tamaño, semilla)
+    random.seed(semilla)
+    gc.collect()
+    inicio = time.perf_counter()
+    ejecutar()
+    return time.perf_counter() - inicio
+
+
+# Ejecuta una muestra con tracemalloc y retorna el pico de memoria en bytes
+def medir_memoria(preparar, tamaño, semilla):
+    ejecutar = preparar(tamaño, semilla)
+    random.seed(semilla)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        ejecutar()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico
+
+
+# Corre la suite completa, cada muestra con la misma semilla
+def ejecutar_suite(muestras, semilla):
+    resultados = {}
+    for nombre, preparar, tamaño in SUITE:
+        # Calentamiento para no medir imports ni caches frias
+        medir_tiempo(preparar, tamaño, semilla)
+        tiempos = [medir_tiempo(preparar, tamaño, semilla) for _ in range(muestras)]
+        resultados[nombre] = {
+            "tamaño": tamaño,
+            "tiempos": tiempos,
+            "memoria_pico": medir_memoria(preparar, tamaño, semilla),
+        }
+    return resultados
+
+
+# Prueba U de Mann-Whitney unilateral (H1: actual mas lento que base), aproximacion normal
+def mann_whitney_mayor(actual, base):
+    n1, n2 = len(actual), len(base)
+    valores = sorted([(v, 0) for v in actual] + [(v, 1) for v in base])
+
+    # Rangos promedio para empates
+    rangos = [0.0] * len(valores)
+    correccion = 0.0
+    i = 0
+    while i < len(valores):
+        j = i
+        while j + 1 < len(valores) and valores[j + 1][0] == valores[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            rangos[k] = (i + j) / 2 + 1
+        t = j - i + 1
+        correccion += t ** 3 - t
+        i = j + 1
+
+    r1 = sum(r for r, (_, grupo) in zip(rangos, valores) if grupo == 0)
+    u1 = r1 - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    varianza = n1 * n2 / 12 * ((n + 1) - correccion / (n * (n - 1)))
+    if varianza <= 0:
+        return 1.0
+    z = (u1 - n1 * n2 / 2 - 0.5) / varianza ** 0.5
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+# Compara resultados actuales contra el baseline, retorna filas de la tabla
+def comparar(actual, base, umbral, umbral_memoria, alfa, minimo_memoria=4096):
+    filas = []
+    for nombre, datos in actual.items():
+        if not base.get(nombre, {}).get("tiempos"):
+            filas.append((nombre, statistics.median(datos["tiempos"]), None, None, None, None, "SIN BASE"))
+            continue
+
+        referencia = base[nombre]
+        mediana = statistics.median(datos["tiempos"])
+        mediana_base = statistics.median(referencia["tiempos"])
+        # Un baseline editado o truncado puede tener mediana 0
+        razon_tiempo = mediana / mediana_base if mediana_base > 0 else float("inf")
+        p = mann_whitney_mayor(datos["tiempos"], referencia["tiempos"])
+        razon_memoria = datos["memoria_pico"] / max(1, referencia["memoria_pico"])
+
+        estado = []
+        # Un tiempo solo es regresion si es significativo y supera el umbral
+        if p < alfa and razon_tiempo > 1 + umbral:
+            estado.append("LENTO")
+        # Picos pequeños varian por un solo objeto, se exige ademas un aumento absoluto
+        aumento_memoria = datos["memoria_pico"] - referencia["memoria_pico"]
+        if razon_memoria > 1 + umbral_memoria and aumento_memoria > minimo_memoria:
+            estado.append("MEMORIA")
+        filas.append((nombre, mediana, mediana_base, razon_tiempo, p, razon_memoria, " ".join(estado) or "OK"))
+
+    # Un caso del baseline que ya no se ejecuta es un fallo, no se descarta en silencio
+    for nombre in base:
+        if nombre not in actual:
+            filas.append((nombre, None, None, None, None, None, "FALTA"))
+    return filas
+
+
+def imprimir_tabla(filas):
+    encabezado = f"{'Funcion':<38} {'Mediana':>10} {'Base':>10} {'x Tiempo':>9} {'p':>7} {'x Memoria':>10}  Estado"
+    print(encabezado)
+    print("-" * len(encabezado))
+    for nombre, mediana, mediana_base, razon_tiempo, p, razon_memoria, estado in filas:
+        if mediana_base is None:
+            actual = f"{mediana * 1e3:>8.2f}ms" if mediana is not None else f"{'-':>10}"
+            print(f"{nombre:<38} {actual} {'-':>10} {'-':>9} {'-':>7} {'-':>10}  {estado}")
+            continue
+        print(f"{nombre:<38} {mediana * 1e3:>8.2f}ms {mediana_base * 1e3:>8.2f}ms {razon_tiempo:>9.2f} "
+              f"{p:>7.3f} {razon_memoria:>10.2f}  {estado}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Compara el rendimiento de la suite estandar contra un baseline")
+    parser.add_argument("--baseline", default=BASELINE, help="archivo JSON con el baseline")
+    parser.add_argument("--guardar", action="store_true", help="sobrescribe el baseline con esta ejecucion")
+    parser.add_argument("--muestras", type=int, default=20, help="repeticiones por funcion")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--umbral", type=float, default=0.25, help="aumento de tiempo tolerado (0.25 = 25%%)")
+    parser.add_argument("--umbral-memoria", type=float, default=0.10, help="aumento de memoria tolerado")
+    parser.add_argument("--minimo-memoria", type=int, default=4096,
+                        help="aumento de memoria minimo en bytes para marcar regresion")
+    parser.add_argument("--alfa", type=float, default=0.05, help="nivel de significancia de la prueba")
+    args = parser.parse_args()
+    if args.muestras < 1:
+        parser.error("--muestras debe ser al menos 1")
+
+    resultados = ejecutar_suite(args.muestras, args.semilla)
+
+    if args.guardar:
+        with open(args.baseline, "w", encoding="utf-8") as archivo:
+            json.dump({"semilla": args.semilla, "muestras": args.muestras, "casos": resultados},
+                      archivo, indent=2, ensure_ascii=False)
+        print(f"Baseline guardado en {args.baseline}")
+        exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"FALLO: No existe el baseline {args.baseline}, ejecutar con --guardar")
+        exit(1)
+
+    with open(args.baseline, encoding="utf-8") as archivo:
+        base = json.load(archivo)
+
+    if base.get("semilla") != args.semilla:
+        print(f"Aviso: baseline generado con semilla {base.get('semilla')}, actual {args.semilla}", file=sys.stderr)
+
+    filas = comparar(resultados, base["casos"], args.umbral, args.umbral_memoria, args.alfa, args.minimo_memoria)
+    imprimir_tabla(filas)
+
+    sin_base = [fila[0] for fila in filas if fila[-1] == "SIN BASE"]
+    if sin_base:
+        print(f"\nAviso: {len(sin_base)} funcion(es) sin baseline, regenerar con --guardar", file=sys.stderr)
+
+    regresiones = [fila for fila in filas if fila[-1] not in ("OK", "SIN BASE")]
+    if regresiones:
+        print(f"\nFALLO: {len(regresiones)} funcion(es) con regresion o ausentes en esta ejecucion")
+        exit(1)  # Fallo
+    print("\nEXITO: Sin regresiones")
+    exit(0)  # Exito
@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+
+# Conexion a servidor.py: envia una peticion JSON por linea y mide su latencia
+class Cliente:
+
+    def __init__(self, lector, escritor):
+        self.lector = lector
+        self.escritor = escritor
+        # Latencias por operacion: cada op tiene una distribucion distinta
+        self.latencias = {}
+
+    @classmethod
+    async def conectar(cls, host, puerto, socket_unix=None):
+        if socket_unix:
+            lector, escritor = await asyncio.open_unix_connection(socket_unix)
+        else:
+            lector, escritor = await asyncio.open_connection(host, puerto)
+        return cls(lector, escritor)
+
+    async def pedir(self, **peticion):
+        inicio = time.perf_counter()
+        self.escritor.write(json.dumps(peticion).encode() + b"\n")
+        await self.escritor.drain()
+        respuesta = json.loads(await self.lector.readline())
+        self.latencias.setdefault(peticion["op"], []).append(time.perf_counter() - inicio)
+        if not respuesta["ok"]:
+            raise RuntimeError(respuesta["error"])
+        return respuesta
+
+    async def cerrar(self):
+        self.escritor.close()
+        try:
+            await self.escritor.wait_closed()
+        except OSError:
+            pass
+
+
+# Una simulacion completa: crear laberinto, agente y avanzar hasta terminar
+async def simular(args):
+    try:
+        cliente = await Cliente.conectar(args.host, args.puerto, args.unix)
+    except OSError as error:
+        return {}, False, f"conexion: {error}"
+
+    exito = False
+    error = None
+    try:
+        laberinto = (await cliente.pedir(op="crear_laberinto", tamaño=args.tamaño))["laberinto"]
+        agente = (await cliente.pedir(op="crear_agente", laberinto=laberinto, tipo=args.tipo))["agente"]
+        for _ in range(args.max_pasos // args.pasos):
+            estado = await cliente.pedir(op="avanzar", laberinto=laberinto, agente=agente, pasos=args.pasos)
+            if estado["terminado"]:
+                exito = estado["exito"]
+                break
+        await cliente.pedir(op="estado", laberinto=laberinto)
+        await cliente.pedir(op="eliminar", laberinto=laberinto)
+    except (RuntimeError, OSError, ValueError) as excepcion:
+        # Un error no debe abortar la carga completa, se cuenta y se reporta
+        error = str(excepcion)
+    finally:
+        await cliente.cerrar()
+    return cliente.latencias, exito, error
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))]
+
+
+async def main(args):
+    inicio = time.perf_counter()
+    resultados = await asyncio.gather(*(simular(args) for _ in range(args.concurrencia)))
+    duracion = time.perf_counter() - inicio
+
+    latencias = {}
+    for por_operacion, _, _ in resultados:
+        for operacion, valores in por_operacion.items():
+            latencias.setdefault(operacion, []).extend(valores)
+    exitos = sum(1 for _, exito, _ in resultados if exito)
+    errores = [error for _, _, error in resultados if error]
+    total = sum(len(valores) for valores in latencias.values())
+
+    print(f"Simulaciones: {args.concurrencia}  Exitos: {exitos}  Errores: {len(errores)}")
+    for error in sorted(set(errores)):
+        print(f"  {errores.count(error)} x {error}")
+    if not total:
+        print("FALLO: Ninguna peticion respondida")
+        return
+    print(f"Peticiones: {total} en {duracion:.2f}s ({total / duracion:.1f} pet/s)")
+
+    # Una fila por operacion, latencias en ms
+    print(f"{'Operacion':<16} {'n':>6} {'media':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for operacion, valores in latencias.items():
+        print(f"{operacion:<16} {len(valores):>6} {statistics.mean(valores) * 1e3:>9.2f} "
+              f"{percentil(valores, 50) * 1e3:>9.2f} {percentil(valores, 95) * 1e3:>9.2f} "
+              f"{percentil(valores, 99) * 1e3:>9.2f} {max(valores) * 1e3:>9.2f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Generador de carga para servidor.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--unix", help="ruta de socket Unix (reemplaza host/puerto)")
+    parser.add_argument("--concurrencia", type=int, default=20, help="simulaciones simultaneas")
+    parser.add_argument("--tamaño", type=int, default=21)
+    parser.add_argument("--tipo", default="ucs", choices=["ucs", "genet"])
+    parser.add_argument("--pasos", type=int, default=5, help="pasos por peticion avanzar")
+    parser.add_argument("--max-pasos", type=int, default=500)
+    args = parser.parse_args()
+    if args.pasos < 1:
+        parser.error("--pasos debe ser al menos 1")
+
+    asyncio.run(main(args))
@@ -7,9 +7,12 @@ from kruskal import generar_kruskal
 
 
 class Laberinto:
-    def __init__(self, tamaño, x_i,y_i, intervalo, num_salidas):
+    def __init__(self, tamaño, x_i,y_i, intervalo, num_salidas, rng=None):
         nodo_inicio=(x_i,y_i)
 
+        # Generador aleatorio propio (random.Random) o el global del modulo
+        self.rng = rng if rng is not None else random
+
         # Configuración básica
         self.tamaño = tamaño if tamaño % 2 == 1 else tamaño + 1
         self.nodo_inicio = nodo_inicio if nodo_inicio else (1, 1)
@@ -41,6 +44,24 @@ class Laberinto:
         self.inicializar_grafo()
         self.generar_salidas()
 
+    def __getstate__(self):
+        """Estado serializable para enviar el laberinto entre procesos, sin Lock ni hilo"""
+        estado = self.__dict__.copy()
+        del estado["lock_grid"]
+        estado["hilo_temporal"] = None
+        estado["ejecutando"] = False
+        # El modulo random no se serializa, se restaura al recibir
+        if estado["rng"] is random:
+            estado["rng"] = None
+        return estado
+
+    def __setstate__(self, estado):
+        """Restaura el laberinto recibido de otro proceso"""
+        self.__dict__.update(estado)
+        self.lock_grid = Lock()
+        if self.rng is None:
+            self.rng = random
+
     def inicializar_grafo(self):
         """Inicializa el grafo con nodos en posiciones impares"""
         # Añadir nodos
@@ -56,7 +77,7 @@ class Laberinto:
             for dx, dy in direcciones:
                 vecino = (x + dx, y + dy)
                 if vecino in self.grafo.nodes():
-                    peso = random.uniform(0.009, 0.1)
+                    peso = self.rng.uniform(0.009, 0.1)
                     self.grafo.add_edge(nodo, vecino, weight=peso)
 
         # Inicializar posición de inicio
@@ -79,10 +100,10 @@ class Laberinto:
             posibles_salidas.append((self.tamaño - 1, y))  # Derecho
 
         # Seleccionar salidas aleatorias
-        self.salidas = random.sample(posibles_salidas, min(self.num_salidas, len(posibles_salidas)))
+        self.salidas = self.rng.sample(posibles_salidas, min(self.num_salidas, len(posibles_salidas)))
 
         # Asignar salida válida aleatoriamente
-        self.salida_valida = random.choice(self.salidas)
+        self.salida_valida = self.rng.choice(self.salidas)
         self.salidas_falsas = [s for s in self.salidas if s != self.salida_valida]
 
         # Crear aberturas para las salidas
@@ -175,7 +196,7 @@ class Laberinto:
                 for x in range(1, self.tamaño - 1):
                     probabilidad = self.pesos_probabilidad[y, x]
 
-                    if random.random() < probabilidad:
+                    if self.rng.random() < probabilidad:
                         self.grid[y, x] = 1 - self.grid[y, x]
                         cambios += 1
 
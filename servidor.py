@@ -0,0 +1,373 @@
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from types import SimpleNamespace
+
+from laberinto import Laberinto
+from agent_ucsm import A_UCS
+from agent_genet import A_GENET
+
+
+# Agente UCS que avanza paso a paso sobre un laberinto compartido
+class AgenteUCS:
+
+    def __init__(self, laberinto):
+        self.agente = A_UCS(laberinto, *laberinto.nodo_inicio, mostrar=False)
+        self.terminado = False
+        self.exito = False
+
+    def paso(self):
+        if self.agente.meta_alcanzada():
+            self.terminado = self.exito = True
+            return
+        self.agente.mover()
+        if self.agente.meta_alcanzada():
+            self.terminado = self.exito = True
+
+    @property
+    def pos(self):
+        return self.agente.pos
+
+    @property
+    def pasos(self):
+        return self.agente.pasos
+
+
+# Agente genetico: evoluciona en el primer paso y luego recorre el mejor cromosoma.
+# El servicio evoluciona en un proceso aparte y asigna cromosoma antes del primer paso
+class AgenteGenetico:
+
+    def __init__(self, laberinto):
+        self.lab = laberinto
+        tamaño = laberinto.tamaño
+        self.agente = A_GENET(laberinto, *laberinto.nodo_inicio, tamaño * 5, tamaño * 7, mostrar=False)
+        self.pos = laberinto.nodo_inicio
+        self.cromosoma = None
+        self.indice = 0
+        self.pasos = 0
+        self.terminado = False
+        self.exito = False
+
+    def paso(self):
+        if self.cromosoma is None:
+            self.cromosoma = self.agente.evolucionar()
+
+        if self.indice >= len(self.cromosoma):
+            self.terminado = True
+            return
+
+        dx, dy = self.cromosoma[self.indice]
+        self.indice += 1
+        x, y = self.pos
+        nx, ny = x + dx, y + dy
+
+        # Validar limites y paredes dinamicas
+        if 0 <= nx < self.lab.tamaño and 0 <= ny < self.lab.tamaño and self.lab.grid[ny, nx] == 0:
+            self.pos = (nx, ny)
+            self.pasos += 1
+
+        if self.pos == self.lab.salida_valida:
+            self.terminado = self.exito = True
+        elif self.pos in self.lab.salidas_falsas:
+            self.terminado = True
+
+    def instantanea(self):
+        """Copia serializable de lo que A_GENET lee del laberinto, para evolucionar en otro proceso"""
+        with self.lab.lock_grid:
+            grid = self.lab.grid.copy()
+        return SimpleNamespace(
+            tamaño=self.lab.tamaño,
+            grid=grid,
+            salidas_falsas=list(self.lab.salidas_falsas),
+            salida_valida=self.lab.salida_valida,
+        )
+
+
+# Evoluciona un A_GENET sobre una instantanea; se ejecuta en el pool de procesos
+def evolucionar_en_proceso(instantanea, pos, cromosomas, generacion, semilla):
+    # Cada proceso del pool atiende una tarea a la vez, puede sembrar su random global
+    random.seed(semilla)
+    agente = A_GENET(instantanea, *pos, cromosomas, generacion, mostrar=False)
+    return agente.evolucionar()
+
+
+TIPOS_AGENTE = {"ucs": AgenteUCS, "genet": AgenteGenetico}
+
+
+# Laberinto en memoria con sus agentes; los cambios dinamicos avanzan con los pasos, sin hilo propio
+class Simulacion:
+
+    def __init__(self, laberinto):
+        self.laberinto = laberinto
+        self.agentes = {}
+        self.lock = asyncio.Lock()
+
+    def actualizar(self):
+        """Aplica los cambios dinamicos si ya transcurrio el intervalo, igual que actualizacion_temporal"""
+        ahora = time.time()
+        if ahora - self.laberinto.ultima_actualizacion >= self.laberinto.obtener_intervalo_actual():
+            self.laberinto.ejecutar_cambios_dinamicos()
+            self.laberinto.ultima_actualizacion = ahora
+
+    def avanzar(self, agente, pasos):
+        """Avanza un agente hasta N pasos, se ejecuta en el pool de trabajadores"""
+        for _ in range(pasos):
+            if agente.terminado:
+                break
+            self.actualizar()
+            agente.paso()
+        return agente
+
+    def estado(self):
+        lab = self.laberinto
+        with lab.lock_grid:
+            grid = ["".join(str(c) for c in fila) for fila in lab.grid.tolist()]
+        return {
+            "tamaño": lab.tamaño,
+            "grid": grid,
+            "salidas": lab.salidas,
+            "agentes": {id_agente: estado_agente(a) for id_agente, a in self.agentes.items()},
+        }
+
+
+def estado_agente(agente):
+    return {"pos": agente.pos, "pasos": agente.pasos, "terminado": agente.terminado, "exito": agente.exito}
+
+
+# Genera un laberinto completo; CPU intensivo, se llama desde el pool de procesos
+def generar_laberinto(tamaño, semilla=None):
+    # Con semilla usa un generador propio, independiente del global
+    rng = random.Random(semilla) if semilla is not None else None
+    laberinto = Laberinto(tamaño=tamaño, x_i=1, y_i=1, intervalo=10.0, num_salidas=tamaño // 3, rng=rng)
+    laberinto.generar_completamente()
+    return laberinto
+
+
+# Laberinto redondea los tamaños pares al impar siguiente
+def normalizar_tamaño(tamaño):
+    return tamaño if tamaño % 2 == 1 else tamaño + 1
+
+
+# Consume el resto de una linea mas larga que el limite del StreamReader, sin guardarla
+async def descartar_linea(lector):
+    while True:
+        try:
+            await lector.readuntil(b"\n")
+            return
+        except asyncio.LimitOverrunError as error:
+            await lector.readexactly(error.consumed)
+        except asyncio.IncompleteReadError:
+            return
+
+
+class ErrorPeticion(Exception):
+    pass
+
+
+# Servicio asyncio que mantiene simulaciones y laberintos precalentados en memoria
+class Servicio:
+
+    def __init__(self, trabajadores=4, precalentar=(), reserva=2, tamaño_maximo=101, pasos_maximo=1000,
+                 procesos=None):
+        # Hilos para los pasos livianos que modifican el estado de las simulaciones, que vive en este proceso
+        self.pool = ThreadPoolExecutor(max_workers=trabajadores)
+        # Procesos para el trabajo pesado (generacion y evolucion), que corre en paralelo fuera del GIL
+        self.procesos = ProcessPoolExecutor(max_workers=procesos or os.cpu_count(),
+                                            mp_context=multiprocessing.get_context("spawn"))
+        self.simulaciones = {}
+        self.reservas = {normalizar_tamaño(tamaño): [] for tamaño in precalentar}
+        self.tamaño_maximo = tamaño_maximo
+        self.pasos_maximo = pasos_maximo
+        self.reserva = reserva
+        self.tarea_precalentar = None
+        self.ids = itertools.count(1)
+        self.peticiones = 0
+
+    async def ejecutar_en_pool(self, funcion, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.pool, funcion, *args)
+
+    async def ejecutar_en_procesos(self, funcion, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.procesos, funcion, *args)
+
+    def cerrar(self):
+        self.pool.shutdown()
+        self.procesos.shutdown()
+
+    async def precalentar(self):
+        """Llena la reserva de laberintos para cada tamaño configurado"""
+        for tamaño, disponibles in self.reservas.items():
+            while len(disponibles) < self.reserva:
+                disponibles.append(await self.ejecutar_en_procesos(generar_laberinto, tamaño))
+
+    async def crear_laberinto(self, peticion):
+        tamaño = normalizar_tamaño(int(peticion.get("tamaño", 11)))
+        semilla = peticion.get("semilla")
+        if tamaño < 5:
+            raise ErrorPeticion("tamaño minimo: 5")
+        if tamaño > self.tamaño_maximo:
+            raise ErrorPeticion(f"tamaño maximo: {self.tamaño_maximo}")
+        disponibles = self.reservas.get(tamaño)
+
+        # Un laberinto con semilla debe ser reproducible, no se toma de la reserva
+        if semilla is None and disponibles:
+            laberinto = disponibles.pop()
+            # Una sola tarea de reposicion a la vez para no sobrellenar la reserva
+            if self.tarea_precalentar is None or self.tarea_precalentar.done():
+                self.tarea_precalentar = asyncio.create_task(self.precalentar())
+        else:
+            laberinto = await self.ejecutar_en_procesos(generar_laberinto, tamaño, semilla)
+
+        id_laberinto = f"l{next(self.ids)}"
+        self.simulaciones[id_laberinto] = Simulacion(laberinto)
+        return {"laberinto": id_laberinto, "tamaño": laberinto.tamaño}
+
+    async def crear_agente(self, peticion):
+        simulacion = self.obtener_simulacion(peticion)
+        tipo = peticion.get("tipo", "ucs")
+        if tipo not in TIPOS_AGENTE:
+            raise ErrorPeticion(f"tipo de agente desconocido: {tipo}")
+
+        id_agente = f"a{next(self.ids)}"
+        simulacion.agentes[id_agente] = TIPOS_AGENTE[tipo](simulacion.laberinto)
+        return {"agente": id_agente}
+
+    async def avanzar(self, peticion):
+        simulacion = self.obtener_simulacion(peticion)
+        id_agente = peticion.get("agente")
+        if id_agente not in simulacion.agentes:
+            raise ErrorPeticion(f"agente inexistente: {id_agente}")
+        pasos = int(peticion.get("pasos", 1))
+        if pasos < 1:
+            raise ErrorPeticion("pasos minimo: 1")
+        if pasos > self.pasos_maximo:
+            raise ErrorPeticion(f"pasos maximo: {self.pasos_maximo}")
+
+        agente = simulacion.agentes[id_agente]
+
+        # Un solo paso a la vez por laberinto
+        async with simulacion.lock:
+            # La evolucion corre en un proceso sobre una instantanea; el cromosoma vuelve a este proceso
+            if isinstance(agente, AgenteGenetico) and agente.cromosoma is None:
+                agente.cromosoma = await self.ejecutar_en_procesos(
+                    evolucionar_en_proceso, agente.instantanea(), agente.pos,
+                    agente.agente.cromosoma, agente.agente.generacion, random.getrandbits(64)
+                )
+            await self.ejecutar_en_pool(simulacion.avanzar, agente, pasos)
+        return estado_agente(agente)
+
+    async def estado(self, peticion):
+        return self.obtener_simulacion(peticion).estado()
+
+    async def eliminar(self, peticion):
+        self.obtener_simulacion(peticion)
+        del self.simulaciones[peticion["laberinto"]]
+        return {}
+
+    async def metricas(self, peticion):
+        return {
+            "peticiones": self.peticiones,
+            "simulaciones": len(self.simulaciones),
+            "reservas": {tamaño: len(d) for tamaño, d in self.reservas.items()},
+        }
+
+    def obtener_simulacion(self, peticion):
+        id_laberinto = peticion.get("laberinto")
+        if id_laberinto not in self.simulaciones:
+            raise ErrorPeticion(f"laberinto inexistente: {id_laberinto}")
+        return self.simulaciones[id_laberinto]
+
+    async def despachar(self, peticion):
+        if not isinstance(peticion, dict):
+            raise ErrorPeticion("la peticion debe ser un objeto JSON")
+        operaciones = {
+            "crear_laberinto": self.crear_laberinto,
+            "crear_agente": self.crear_agente,
+            "avanzar": self.avanzar,
+            "estado": self.estado,
+            "eliminar": self.eliminar,
+            "metricas": self.metricas,
+        }
+        operacion = peticion.get("op")
+        if operacion not in operaciones:
+            raise ErrorPeticion(f"operacion desconocida: {operacion}")
+        return await operaciones[operacion](peticion)
+
+    async def atender(self, lector, escritor):
+        """Protocolo: una peticion JSON por linea, una respuesta JSON por linea"""
+        try:
+            while True:
+                try:
+                    linea = await lector.readuntil(b"\n")
+                except asyncio.IncompleteReadError as error:
+                    linea = error.partial
+                except asyncio.LimitOverrunError:
+                    # Linea sobre el limite del StreamReader: se descarta completa y se responde el error
+                    await descartar_linea(lector)
+                    respuesta = {"ok": False, "error": "peticion demasiado larga"}
+                    escritor.write(json.dumps(respuesta, ensure_ascii=False).encode() + b"\n")
+                    await escritor.drain()
+                    continue
+                if not linea:
+                    break
+
+                self.peticiones += 1
+                try:
+                    respuesta = {"ok": True, **await self.despachar(json.loads(linea))}
+                except (ErrorPeticion, ValueError, TypeError) as error:
+                    respuesta = {"ok": False, "error": str(error)}
+                except Exception as error:
+                    # Ultimo recurso: una peticion no debe cerrar la conexion
+                    respuesta = {"ok": False, "error": f"error interno: {type(error).__name__}: {error}"}
+                escritor.write(json.dumps(respuesta, ensure_ascii=False).encode() + b"\n")
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def iniciar(self, host="127.0.0.1", puerto=8765, socket_unix=None):
+        await self.precalentar()
+        if socket_unix:
+            servidor = await asyncio.start_unix_server(self.atender, path=socket_unix)
+            print(f"Servicio escuchando en {socket_unix}")
+        else:
+            servidor = await asyncio.start_server(self.atender, host, puerto)
+            print(f"Servicio escuchando en {host}:{puerto}")
+        async with servidor:
+            await servidor.serve_forever()
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Servicio de simulacion de laberintos")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--unix", help="ruta de socket Unix (reemplaza host/puerto)")
+    parser.add_argument("--trabajadores", type=int, default=4, help="hilos para los pasos de los agentes")
+    parser.add_argument("--procesos", type=int, default=None,
+                        help="procesos para generar laberintos y evolucionar (por defecto, uno por CPU)")
+    parser.add_argument("--precalentar", default="11,21", help="tamaños a mantener generados, separados por coma")
+    parser.add_argument("--reserva", type=int, default=2, help="laberintos precalentados por tamaño")
+    parser.add_argument("--tamaño-maximo", type=int, default=101, help="tamaño maximo de laberinto aceptado")
+    parser.add_argument("--pasos-maximo", type=int, default=1000, help="pasos maximos por peticion avanzar")
+    args = parser.parse_args()
+
+    tamaños = [int(t) for t in args.precalentar.split(",") if t]
+    servicio = Servicio(args.trabajadores, tamaños, args.reserva, args.tamaño_maximo, args.pasos_maximo,
+                        args.procesos)
+    try:
+        asyncio.run(servicio.iniciar(args.host, args.puerto, args.unix))
+    except KeyboardInterrupt:
+        print("Servicio detenido")
+    finally:
+        servicio.cerrar()
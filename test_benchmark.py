@@ -0,0 +1,71 @@
+import unittest
+
+from benchmark import mann_whitney_mayor, comparar
+
+
+# Caso con tiempos y pico de memoria, en el formato del baseline
+def caso(tiempos, memoria_pico=100000):
+    return {"tiempos": tiempos, "memoria_pico": memoria_pico}
+
+
+BASE = [1.00, 1.01, 0.99, 1.02, 0.98, 1.00, 1.01, 0.99, 1.00, 1.02]
+
+
+class PruebasMannWhitney(unittest.TestCase):
+
+    def test_desplazamiento_claro(self):
+        actual = [t * 1.5 for t in BASE]
+        self.assertLess(mann_whitney_mayor(actual, BASE), 0.001)
+
+    def test_muestras_identicas(self):
+        self.assertAlmostEqual(mann_whitney_mayor(BASE, BASE), 0.5, delta=0.05)
+
+    def test_todos_empatados(self):
+        self.assertEqual(mann_whitney_mayor([1.0] * 5, [1.0] * 5), 1.0)
+
+    def test_actual_mas_rapido(self):
+        actual = [t * 0.5 for t in BASE]
+        self.assertGreater(mann_whitney_mayor(actual, BASE), 0.99)
+
+
+class PruebasComparar(unittest.TestCase):
+
+    def estado(self, actual, base, **kwargs):
+        opciones = {"umbral": 0.25, "umbral_memoria": 0.10, "alfa": 0.05, "minimo_memoria": 4096}
+        opciones.update(kwargs)
+        filas = comparar(actual, base, **opciones)
+        return {fila[0]: fila[-1] for fila in filas}
+
+    def test_sin_cambios(self):
+        self.assertEqual(self.estado({"f": caso(BASE)}, {"f": caso(BASE)}), {"f": "OK"})
+
+    def test_lento(self):
+        actual = {"f": caso([t * 1.5 for t in BASE])}
+        self.assertEqual(self.estado(actual, {"f": caso(BASE)}), {"f": "LENTO"})
+
+    def test_lento_significativo_bajo_el_umbral(self):
+        actual = {"f": caso([t * 1.1 for t in BASE])}
+        self.assertLess(mann_whitney_mayor(actual["f"]["tiempos"], BASE), 0.05)
+        self.assertEqual(self.estado(actual, {"f": caso(BASE)}), {"f": "OK"})
+
+    def test_memoria_bajo_el_minimo_absoluto(self):
+        actual = {"f": caso(BASE, memoria_pico=353)}
+        self.assertEqual(self.estado(actual, {"f": caso(BASE, memoria_pico=320)}), {"f": "OK"})
+
+    def test_memoria_sobre_ambos_limites(self):
+        actual = {"f": caso(BASE, memoria_pico=200000)}
+        self.assertEqual(self.estado(actual, {"f": caso(BASE)}), {"f": "MEMORIA"})
+
+    def test_mediana_base_cero(self):
+        actual = {"f": caso([t * 1.5 for t in BASE])}
+        filas = comparar(actual, {"f": caso([0.0] * 10)}, 0.25, 0.10, 0.05)
+        self.assertEqual(filas[0][3], float("inf"))
+        self.assertEqual(filas[0][-1], "LENTO")
+
+    def test_caso_nuevo_y_caso_ausente(self):
+        estados = self.estado({"nuevo": caso(BASE)}, {"viejo": caso(BASE)})
+        self.assertEqual(estados, {"nuevo": "SIN BASE", "viejo": "FALTA"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import asyncio
+import json
+import unittest
+
+from cliente_carga import Cliente
+from servidor import Servicio, Simulacion, AgenteUCS, generar_laberinto
+
+
+# Pruebas del protocolo de servidor.py sobre un socket TCP local real
+class PruebasServicio(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.servicio = Servicio(trabajadores=4, precalentar=[11], reserva=1, tamaño_maximo=61, procesos=2)
+        await self.servicio.precalentar()
+        self.servidor = await asyncio.start_server(self.servicio.atender, "127.0.0.1", 0)
+        self.puerto = self.servidor.sockets[0].getsockname()[1]
+        self.cliente = await Cliente.conectar("127.0.0.1", self.puerto)
+
+    async def asyncTearDown(self):
+        await self.cliente.cerrar()
+        self.servidor.close()
+        await self.servidor.wait_closed()
+        self.servicio.cerrar()
+
+    # Envia una linea cruda y retorna la respuesta sin validar "ok"
+    async def enviar_crudo(self, linea):
+        self.cliente.escritor.write(linea + b"\n")
+        await self.cliente.escritor.drain()
+        return json.loads(await self.cliente.lector.readline())
+
+    async def test_crear_avanzar_estado(self):
+        laberinto = await self.cliente.pedir(op="crear_laberinto", tamaño=11, semilla=3)
+        self.assertEqual(laberinto["tamaño"], 11)
+        agente = await self.cliente.pedir(op="crear_agente", laberinto=laberinto["laberinto"], tipo="ucs")
+
+        paso = await self.cliente.pedir(op="avanzar", laberinto=laberinto["laberinto"], agente=agente["agente"], pasos=3)
+        self.assertEqual(paso["pasos"], 3)
+
+        estado = await self.cliente.pedir(op="estado", laberinto=laberinto["laberinto"])
+        self.assertEqual(len(estado["grid"]), 11)
+        self.assertEqual(estado["agentes"][agente["agente"]]["pos"], paso["pos"])
+
+        await self.cliente.pedir(op="eliminar", laberinto=laberinto["laberinto"])
+        self.assertEqual(self.servicio.simulaciones, {})
+
+    async def test_agente_genetico_evoluciona_en_proceso(self):
+        laberinto = (await self.cliente.pedir(op="crear_laberinto", tamaño=11, semilla=2))["laberinto"]
+        agente = (await self.cliente.pedir(op="crear_agente", laberinto=laberinto, tipo="genet"))["agente"]
+
+        await self.cliente.pedir(op="avanzar", laberinto=laberinto, agente=agente, pasos=1)
+        genetico = self.servicio.simulaciones[laberinto].agentes[agente]
+        self.assertEqual(len(genetico.cromosoma), 11 * 5)
+        self.assertEqual(genetico.indice, 1)
+
+    async def test_errores(self):
+        laberinto = (await self.cliente.pedir(op="crear_laberinto", tamaño=11))["laberinto"]
+        agente = (await self.cliente.pedir(op="crear_agente", laberinto=laberinto))["agente"]
+        peticiones = [
+            {"op": "desconocida"},
+            {"op": "estado", "laberinto": "l999"},
+            {"op": "avanzar", "laberinto": laberinto, "agente": "a999"},
+            {"op": "crear_agente", "laberinto": laberinto, "tipo": "otro"},
+            {"op": "crear_laberinto", "tamaño": 3},
+            {"op": "crear_laberinto", "tamaño": 101},
+            {"op": "avanzar", "laberinto": laberinto, "agente": agente, "pasos": 0},
+            {"op": "avanzar", "laberinto": laberinto, "agente": agente, "pasos": 10 ** 9},
+        ]
+        for peticion in peticiones:
+            respuesta = await self.enviar_crudo(json.dumps(peticion).encode())
+            self.assertFalse(respuesta["ok"], peticion)
+
+        for linea in [b"no es json", b"[1, 2]", b"5"]:
+            respuesta = await self.enviar_crudo(linea)
+            self.assertFalse(respuesta["ok"], linea)
+
+        # Lineas sobre el limite de 64 KiB del StreamReader, completas o en partes
+        respuesta = await self.enviar_crudo(b'{"op": "' + b"x" * 100000 + b'"}')
+        self.assertFalse(respuesta["ok"])
+        for _ in range(3):
+            self.cliente.escritor.write(b"x" * 50000)
+            await self.cliente.escritor.drain()
+            await asyncio.sleep(0.01)
+        respuesta = await self.enviar_crudo(b"")
+        self.assertFalse(respuesta["ok"])
+
+        # La conexion sigue viva despues de los errores
+        self.assertTrue((await self.cliente.pedir(op="metricas"))["ok"])
+
+    async def test_semilla_reproducible_concurrente(self):
+        clientes = [await Cliente.conectar("127.0.0.1", self.puerto) for _ in range(16)]
+        respuestas = await asyncio.gather(*(c.pedir(op="crear_laberinto", tamaño=51, semilla=7) for c in clientes))
+        for c in clientes:
+            await c.cerrar()
+
+        grids = {tuple(self.servicio.simulaciones[r["laberinto"]].estado()["grid"]) for r in respuestas}
+        self.assertEqual(len(grids), 1)
+        self.assertEqual(grids.pop(), tuple(Simulacion(generar_laberinto(51, 7)).estado()["grid"]))
+
+    async def test_tamaño_par_usa_reserva(self):
+        precalentado = self.servicio.reservas[11][0]
+        respuesta = await self.cliente.pedir(op="crear_laberinto", tamaño=10)
+        self.assertEqual(respuesta["tamaño"], 11)
+        self.assertIs(self.servicio.simulaciones[respuesta["laberinto"]].laberinto, precalentado)
+
+
+class PruebasSimulacion(unittest.TestCase):
+
+    def test_avanzar_hasta_la_salida(self):
+        simulacion = Simulacion(generar_laberinto(11, 5))
+        agente = AgenteUCS(simulacion.laberinto)
+
+        simulacion.avanzar(agente, 500)
+        self.assertTrue(agente.terminado)
+        self.assertTrue(agente.exito)
+        self.assertEqual(agente.pos, simulacion.laberinto.salida_valida)
+
+        # Un agente terminado no avanza mas
+        pasos = agente.pasos
+        simulacion.avanzar(agente, 10)
+        self.assertEqual(agente.pasos, pasos)
+
+
+if __name__ == "__main__":
+    unittest.main()